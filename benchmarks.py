@@ -0,0 +1,606 @@
+"""
+Benchmark Suite for Linked Lists and Binary Trees
+
+Times every public operation at a range of sizes, side by side with the
+built-in containers (list, collections.deque, heapq, bisect), and records
+the tracemalloc peak of each run.  Results can be saved as JSON and diffed
+against a saved baseline to catch performance regressions:
+
+    python benchmarks.py --sizes 1e3 1e4 1e5 --output current.json
+    python benchmarks.py --baseline current.json --threshold 0.2
+"""
+
+import argparse
+import bisect
+import heapq
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass
+from itertools import islice
+from timeit import default_timer as timer
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from binary_tree import BinaryTree
+from linked_lists import (CircularLinkedList, DoublyLinkedList, Node, PersistentLinkedList,
+                          SinglyLinkedList, merge_sorted_lists)
+
+
+# Number of calls made by the per-call cases (push/pop/get/...)
+BATCH = 100
+
+# Per-call O(n) operations repeated BATCH times are skipped above this size
+LINEAR_BATCH_LIMIT = 10 ** 6
+
+# Element-by-element transfers that pop a SinglyLinkedList from the back are O(n^2)
+QUADRATIC_LIMIT = 10 ** 4
+
+DEFAULT_SIZES = (10 ** 3, 10 ** 4, 10 ** 5)
+
+# Timed samples per case and size; the median is reported
+DEFAULT_REPEAT = 5
+
+# Each sample loops the run until this many seconds have been timed
+DEFAULT_SAMPLE_TIME = 0.2
+
+# ...or until setup plus runs have taken this many times as long
+SETUP_BUDGET = 10
+
+# Groups whose runs leave their input unchanged (or reversible), so one
+# input is reused across runs instead of being rebuilt before each one
+READ_ONLY_GROUPS = frozenset({'build', 'search', 'get', 'slice', 'stream', 'iterate',
+                              'to_list', 'reverse', 'get_middle', 'detect_loop',
+                              'height', 'depth'})
+
+
+@dataclass
+class Case:
+    """One benchmarked operation: setup(n) builds the untimed input, run(state) is timed."""
+    group: str
+    name: str
+    setup: Callable[[int], Any]
+    run: Callable[[Any], Any]
+    max_size: Optional[int] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.group}/{self.name}"
+
+
+# ========== INPUT BUILDERS ==========
+
+def _sll(n: int) -> SinglyLinkedList:
+    """Return a singly linked list holding 0..n-1, built in O(n)."""
+    lst = SinglyLinkedList()
+    for i in range(n - 1, -1, -1):
+        lst.insert_at_beginning(i)
+    return lst
+
+
+def _dll(n: int) -> DoublyLinkedList:
+    """Return a doubly linked list holding 0..n-1."""
+    lst = DoublyLinkedList()
+    for i in range(n):
+        lst.insert_at_end(i)
+    return lst
+
+
+def _cll(n: int) -> CircularLinkedList:
+    """Return a circular list holding 0..n-1, linked directly in O(n)."""
+    lst = CircularLinkedList()
+    last = None
+    for i in range(n):
+        node = Node(i)
+        if last:
+            last.next = node
+        else:
+            lst.head = node
+        last = node
+    if last:
+        last.next = lst.head
+    lst.tail = last
+    lst._size = n
+    return lst
+
+
+def _tree(n: int) -> BinaryTree:
+    """Return a complete binary tree holding 0..n-1 in level order."""
+    tree = BinaryTree()
+    if n:
+        fringe = deque([tree.add_root(0)])
+        i = 1
+        while i < n:
+            p = fringe.popleft()
+            fringe.append(tree.add_left(p, i))
+            i += 1
+            if i < n:
+                fringe.append(tree.add_right(p, i))
+                i += 1
+    return tree
+
+
+def _tree_and_leaf(n: int) -> tuple:
+    """Return a complete tree of n elements and the Position of its deepest left leaf."""
+    tree = _tree(n)
+    p = tree.root()
+    while tree.left(p) is not None:
+        p = tree.left(p)
+    return tree, p
+
+
+def _halves(n: int, build: Callable[[int], Any]) -> tuple:
+    """Return (evens, odds) of 0..n-1 built with build(), for merge benchmarks."""
+    return build(range(0, n, 2)), build(range(1, n, 2))
+
+
+def _sll_from(values: Sequence[Any]) -> SinglyLinkedList:
+    """Return a singly linked list holding values, built in O(n)."""
+    lst = SinglyLinkedList()
+    for data in reversed(values):
+        lst.insert_at_beginning(data)
+    return lst
+
+
+def _batch(func: Callable[[Any, int], Any]) -> Callable[[Any], None]:
+    """Return a runner that calls func(state, i) for i in range(BATCH)."""
+    def run(state):
+        for i in range(BATCH):
+            func(state, i)
+    return run
+
+
+def _transfer_by_element(target: Any, source: Any) -> None:
+    """Move every element of source to the end of target, one at a time."""
+    while not source.is_empty():
+        target.insert_at_end(source.delete_from_beginning())
+
+
+def _splice_by_element(state: tuple) -> None:
+    """Splice source into the middle of target without node stealing."""
+    target, source, cls = state
+    suffix = cls()
+    for _ in range(len(target) - len(target) // 2):
+        suffix.insert_at_beginning(target.delete_from_end())
+    _transfer_by_element(target, source)
+    _transfer_by_element(target, suffix)
+
+
+def _split_by_element(state: tuple) -> Any:
+    """Split target in the middle by popping the back half."""
+    target, cls = state
+    back = cls()
+    for _ in range(len(target) - len(target) // 2):
+        back.insert_at_beginning(target.delete_from_end())
+    return back
+
+
+def _list_append(n: int) -> list:
+    """Build a list of n elements one append at a time."""
+    lst = []
+    for i in range(n):
+        lst.append(i)
+    return lst
+
+
+def _list_split(lst: list) -> list:
+    """Split lst in the middle, keeping the front half in place."""
+    back = lst[len(lst) // 2:]
+    del lst[len(lst) // 2:]
+    return back
+
+
+# ========== CASES ==========
+
+def _cases() -> List[Case]:
+    """Return every benchmark case, grouped by the operation being compared."""
+    mid = lambda state: len(state) // 2
+    odd = lambda x: x % 2
+    double = lambda x: x * 2
+    cases = [
+        # Building a structure of n elements
+        Case("build", "SinglyLinkedList.insert_at_beginning", lambda n: n, _sll),
+        Case("build", "DoublyLinkedList.insert_at_end", lambda n: n, _dll),
+        Case("build", "PersistentLinkedList(range)", lambda n: n,
+             lambda n: PersistentLinkedList(range(n))),
+        Case("build", "BinaryTree.add_left/add_right", lambda n: n, _tree),
+        Case("build", "list.append", lambda n: n, _list_append),
+        Case("build", "deque(range)", lambda n: n, lambda n: deque(range(n))),
+
+        # BATCH calls at the front
+        Case("push_front", "SinglyLinkedList.insert_at_beginning", _sll,
+             _batch(lambda s, i: s.insert_at_beginning(i))),
+        Case("push_front", "DoublyLinkedList.insert_at_beginning", _dll,
+             _batch(lambda s, i: s.insert_at_beginning(i))),
+        Case("push_front", "CircularLinkedList.insert_at_beginning", _cll,
+             _batch(lambda s, i: s.insert_at_beginning(i))),
+        Case("push_front", "PersistentLinkedList.prepend",
+             lambda n: [PersistentLinkedList(range(n))],
+             _batch(lambda s, i: s.__setitem__(0, s[0].prepend(i)))),
+        Case("push_front", "list.insert(0)", lambda n: list(range(n)),
+             _batch(lambda s, i: s.insert(0, i)), LINEAR_BATCH_LIMIT),
+        Case("push_front", "deque.appendleft", lambda n: deque(range(n)),
+             _batch(lambda s, i: s.appendleft(i))),
+
+        # BATCH calls at the back
+        Case("push_back", "SinglyLinkedList.insert_at_end", _sll,
+             _batch(lambda s, i: s.insert_at_end(i))),
+        Case("push_back", "DoublyLinkedList.insert_at_end", _dll,
+             _batch(lambda s, i: s.insert_at_end(i))),
+        Case("push_back", "CircularLinkedList.insert_at_end", _cll,
+             _batch(lambda s, i: s.insert_at_end(i))),
+        Case("push_back", "list.append", lambda n: list(range(n)),
+             _batch(lambda s, i: s.append(i))),
+        Case("push_back", "deque.append", lambda n: deque(range(n)),
+             _batch(lambda s, i: s.append(i))),
+
+        Case("pop_front", "SinglyLinkedList.delete_from_beginning", _sll,
+             _batch(lambda s, i: s.delete_from_beginning())),
+        Case("pop_front", "DoublyLinkedList.delete_from_beginning", _dll,
+             _batch(lambda s, i: s.delete_from_beginning())),
+        Case("pop_front", "CircularLinkedList.delete_from_beginning", _cll,
+             _batch(lambda s, i: s.delete_from_beginning())),
+        Case("pop_front", "PersistentLinkedList.tail",
+             lambda n: [PersistentLinkedList(range(n))],
+             _batch(lambda s, i: s.__setitem__(0, s[0].tail()))),
+        Case("pop_front", "list.pop(0)", lambda n: list(range(n)),
+             _batch(lambda s, i: s.pop(0)), LINEAR_BATCH_LIMIT),
+        Case("pop_front", "deque.popleft", lambda n: deque(range(n)),
+             _batch(lambda s, i: s.popleft())),
+
+        Case("pop_back", "SinglyLinkedList.delete_from_end", _sll,
+             _batch(lambda s, i: s.delete_from_end()), LINEAR_BATCH_LIMIT),
+        Case("pop_back", "DoublyLinkedList.delete_from_end", _dll,
+             _batch(lambda s, i: s.delete_from_end())),
+        Case("pop_back", "list.pop", lambda n: list(range(n)),
+             _batch(lambda s, i: s.pop())),
+        Case("pop_back", "deque.pop", lambda n: deque(range(n)),
+             _batch(lambda s, i: s.pop())),
+
+        # BATCH calls in the middle
+        Case("insert_middle", "SinglyLinkedList.insert_at_position", _sll,
+             _batch(lambda s, i: s.insert_at_position(i, mid(s))), LINEAR_BATCH_LIMIT),
+        Case("insert_middle", "list.insert", lambda n: list(range(n)),
+             _batch(lambda s, i: s.insert(mid(s), i))),
+        Case("insert_middle", "bisect.insort", lambda n: list(range(n)),
+             _batch(lambda s, i: bisect.insort(s, mid(s)))),
+
+        Case("delete_middle", "SinglyLinkedList.delete_from_position", _sll,
+             _batch(lambda s, i: s.delete_from_position(mid(s))), LINEAR_BATCH_LIMIT),
+        Case("delete_middle", "list.pop(mid)", lambda n: list(range(n)),
+             _batch(lambda s, i: s.pop(mid(s)))),
+
+        Case("delete_value", "SinglyLinkedList.delete_by_value", lambda n: (_sll(n), n // 2),
+             _batch(lambda s, i: s[0].delete_by_value(s[1] + i)), LINEAR_BATCH_LIMIT),
+        Case("delete_value", "list.remove", lambda n: (list(range(n)), n // 2),
+             _batch(lambda s, i: s[0].remove(s[1] + i)), LINEAR_BATCH_LIMIT),
+
+        Case("search", "SinglyLinkedList.search", _sll,
+             _batch(lambda s, i: s.search(mid(s))), LINEAR_BATCH_LIMIT),
+        Case("search", "list.index", lambda n: list(range(n)),
+             _batch(lambda s, i: s.index(mid(s))), LINEAR_BATCH_LIMIT),
+        Case("search", "bisect.bisect_left", lambda n: list(range(n)),
+             _batch(lambda s, i: bisect.bisect_left(s, mid(s)))),
+
+        Case("get", "SinglyLinkedList.get", _sll,
+             _batch(lambda s, i: s.get(mid(s))), LINEAR_BATCH_LIMIT),
+        Case("get", "SinglyLinkedList[i]", _sll,
+             _batch(lambda s, i: s[mid(s)]), LINEAR_BATCH_LIMIT),
+        Case("get", "DoublyLinkedList[i]", _dll,
+             _batch(lambda s, i: s[mid(s)]), LINEAR_BATCH_LIMIT),
+        Case("get", "CircularLinkedList[i]", _cll,
+             _batch(lambda s, i: s[mid(s)]), LINEAR_BATCH_LIMIT),
+        Case("get", "PersistentLinkedList[i]", lambda n: PersistentLinkedList(range(n)),
+             _batch(lambda s, i: s[mid(s)]), LINEAR_BATCH_LIMIT),
+        Case("get", "list[i]", lambda n: list(range(n)), _batch(lambda s, i: s[mid(s)])),
+        Case("get", "deque[i]", lambda n: deque(range(n)), _batch(lambda s, i: s[mid(s)])),
+
+        # Lazy slices and streams: first 100 results
+        Case("slice", "SinglyLinkedList[a:a+100]", _sll,
+             lambda s: list(s[len(s) // 2:len(s) // 2 + 100])),
+        Case("slice", "DoublyLinkedList[::-1][:100]", _dll, lambda s: list(s[::-1][:100])),
+        Case("slice", "list[a:a+100]", lambda n: list(range(n)),
+             lambda s: s[len(s) // 2:len(s) // 2 + 100]),
+        Case("slice", "deque islice", lambda n: deque(range(n)),
+             lambda s: list(islice(s, len(s) // 2, len(s) // 2 + 100))),
+
+        Case("stream", "SinglyLinkedList.stream", _sll,
+             lambda s: s.stream().filter(odd).map(double).take(100).to_list()),
+        Case("stream", "list comprehension", lambda n: list(range(n)),
+             lambda s: list(islice((double(x) for x in s if odd(x)), 100))),
+
+        # Single full passes
+        Case("iterate", "SinglyLinkedList", _sll, lambda s: sum(1 for _ in s)),
+        Case("iterate", "DoublyLinkedList", _dll, lambda s: sum(1 for _ in s)),
+        Case("iterate", "DoublyLinkedList reversed", _dll, lambda s: sum(1 for _ in reversed(s))),
+        Case("iterate", "CircularLinkedList", _cll, lambda s: sum(1 for _ in s)),
+        Case("iterate", "PersistentLinkedList", lambda n: PersistentLinkedList(range(n)),
+             lambda s: sum(1 for _ in s)),
+        Case("iterate", "BinaryTree.preorder", _tree, lambda t: sum(1 for _ in t.preorder())),
+        Case("iterate", "BinaryTree.inorder", _tree, lambda t: sum(1 for _ in t.inorder())),
+        Case("iterate", "BinaryTree.postorder", _tree, lambda t: sum(1 for _ in t.postorder())),
+        Case("iterate", "BinaryTree.breadthfirst", _tree,
+             lambda t: sum(1 for _ in t.breadthfirst())),
+        Case("iterate", "list", lambda n: list(range(n)), lambda s: sum(1 for _ in s)),
+        Case("iterate", "deque", lambda n: deque(range(n)), lambda s: sum(1 for _ in s)),
+
+        Case("to_list", "SinglyLinkedList.to_list", _sll, lambda s: s.to_list()),
+        Case("to_list", "PersistentLinkedList.to_list", lambda n: PersistentLinkedList(range(n)),
+             lambda s: s.to_list()),
+        Case("to_list", "list.copy", lambda n: list(range(n)), lambda s: s.copy()),
+        Case("to_list", "list(deque)", lambda n: deque(range(n)), list),
+
+        Case("reverse", "SinglyLinkedList.reverse", _sll, lambda s: s.reverse()),
+        Case("reverse", "DoublyLinkedList.reverse", _dll, lambda s: s.reverse()),
+        Case("reverse", "PersistentLinkedList.reverse", lambda n: PersistentLinkedList(range(n)),
+             lambda s: s.reverse()),
+        Case("reverse", "list.reverse", lambda n: list(range(n)), lambda s: s.reverse()),
+        Case("reverse", "deque.reverse", lambda n: deque(range(n)), lambda s: s.reverse()),
+
+        Case("get_middle", "SinglyLinkedList.get_middle", _sll, lambda s: s.get_middle()),
+        Case("get_middle", "list[len // 2]", lambda n: list(range(n)), lambda s: s[len(s) // 2]),
+        Case("detect_loop", "SinglyLinkedList.detect_loop", _sll, lambda s: s.detect_loop()),
+        Case("remove_duplicates", "SinglyLinkedList.remove_duplicates",
+             lambda n: _sll_from([i // 2 for i in range(n)]), lambda s: s.remove_duplicates()),
+        Case("remove_duplicates", "dict.fromkeys", lambda n: [i // 2 for i in range(n)],
+             lambda s: list(dict.fromkeys(s))),
+
+        # Moving a second structure of n elements
+        Case("concat", "SinglyLinkedList.concat", lambda n: (_sll(n), _sll(n)),
+             lambda s: s[0].concat(s[1])),
+        Case("concat", "SinglyLinkedList element-by-element", lambda n: (_sll(n), _sll(n)),
+             lambda s: _transfer_by_element(*s)),
+        Case("concat", "DoublyLinkedList.concat", lambda n: (_dll(n), _dll(n)),
+             lambda s: s[0].concat(s[1])),
+        Case("concat", "DoublyLinkedList element-by-element", lambda n: (_dll(n), _dll(n)),
+             lambda s: _transfer_by_element(*s)),
+        Case("concat", "CircularLinkedList.concat", lambda n: (_cll(n), _cll(n)),
+             lambda s: s[0].concat(s[1])),
+        Case("concat", "list.extend", lambda n: (list(range(n)), list(range(n))),
+             lambda s: s[0].extend(s[1])),
+        Case("concat", "deque.extend", lambda n: (deque(range(n)), deque(range(n))),
+             lambda s: s[0].extend(s[1])),
+
+        Case("splice", "SinglyLinkedList.splice", lambda n: (_sll(n), _sll(n)),
+             lambda s: s[0].splice(len(s[0]) // 2, s[1])),
+        Case("splice", "SinglyLinkedList element-by-element",
+             lambda n: (_sll(n), _sll(n), SinglyLinkedList), _splice_by_element, QUADRATIC_LIMIT),
+        Case("splice", "DoublyLinkedList.splice", lambda n: (_dll(n), _dll(n)),
+             lambda s: s[0].splice(len(s[0]) // 2, s[1])),
+        Case("splice", "DoublyLinkedList element-by-element",
+             lambda n: (_dll(n), _dll(n), DoublyLinkedList), _splice_by_element),
+        Case("splice", "CircularLinkedList.splice", lambda n: (_cll(n), _cll(n)),
+             lambda s: s[0].splice(len(s[0]) // 2, s[1])),
+        Case("splice", "list slice assignment", lambda n: (list(range(n)), list(range(n))),
+             lambda s: s[0].__setitem__(slice(len(s[0]) // 2, len(s[0]) // 2), s[1])),
+
+        Case("split_at", "SinglyLinkedList.split_at", _sll, lambda s: s.split_at(len(s) // 2)),
+        Case("split_at", "SinglyLinkedList element-by-element",
+             lambda n: (_sll(n), SinglyLinkedList), _split_by_element, QUADRATIC_LIMIT),
+        Case("split_at", "DoublyLinkedList.split_at", _dll, lambda s: s.split_at(len(s) // 2)),
+        Case("split_at", "DoublyLinkedList element-by-element",
+             lambda n: (_dll(n), DoublyLinkedList), _split_by_element),
+        Case("split_at", "CircularLinkedList.split_at", _cll, lambda s: s.split_at(len(s) // 2)),
+        Case("split_at", "list slice + del", lambda n: list(range(n)), _list_split),
+
+        # Merging two sorted inputs of n/2 elements each
+        Case("merge_sorted", "merge_sorted_lists", lambda n: _halves(n, _sll_from),
+             lambda s: merge_sorted_lists(*s)),
+        Case("merge_sorted", "PersistentLinkedList.merge_sorted",
+             lambda n: _halves(n, PersistentLinkedList), lambda s: s[0].merge_sorted(s[1])),
+        Case("merge_sorted", "heapq.merge", lambda n: _halves(n, list),
+             lambda s: list(heapq.merge(*s))),
+        Case("merge_sorted", "sorted(a + b)", lambda n: _halves(n, list),
+             lambda s: sorted(s[0] + s[1])),
+
+        # Tree analysis
+        Case("height", "BinaryTree.height", _tree, lambda t: t.height()),
+        Case("depth", "BinaryTree.depth", _tree_and_leaf,
+             _batch(lambda s, i: s[0].depth(s[1]))),
+    ]
+    return cases
+
+
+# ========== MEASUREMENT ==========
+
+def _sample(case: Case, n: int, state: Any, sample_time: float) -> float:
+    """Return the mean time of one run, looping until sample_time seconds are timed.
+    A fresh input is built (untimed) before every run unless state is given.
+    Runs whose setup dwarfs them stop after SETUP_BUDGET times sample_time.
+    """
+    runs = 0
+    timed = 0.0
+    started = timer()
+    while True:
+        current = case.setup(n) if state is None else state
+        start = timer()
+        case.run(current)
+        timed += timer() - start
+        runs += 1
+        del current
+        if timed >= sample_time or timer() - started >= SETUP_BUDGET * sample_time:
+            return timed / runs
+
+
+def measure(case: Case, n: int, repeat: int,
+            sample_time: float = DEFAULT_SAMPLE_TIME) -> Dict[str, float]:
+    """Return the median per-run time over repeat samples and the tracemalloc peak of one run.
+    Memory is traced in a separate run so tracing does not distort the timings.
+    """
+    state = case.setup(n) if case.group in READ_ONLY_GROUPS else None
+    samples = [_sample(case, n, state, sample_time) for _ in range(repeat)]
+    del state
+
+    state = case.setup(n)
+    tracemalloc.start()
+    try:
+        case.run(state)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {'time': statistics.median(samples), 'peak': peak}
+
+
+def run_suite(sizes: Sequence[int], repeat: int = DEFAULT_REPEAT, pattern: Optional[str] = None,
+              report: Optional[Callable[[Case, int, Dict[str, float]], None]] = None,
+              sample_time: float = DEFAULT_SAMPLE_TIME) -> Dict[str, Any]:
+    """Run every case whose key contains pattern at every size it supports."""
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for case in _cases():
+        if pattern and pattern not in case.key:
+            continue
+        for n in sizes:
+            if case.max_size is not None and n > case.max_size:
+                continue
+            result = measure(case, n, repeat, sample_time)
+            results.setdefault(case.key, {})[str(n)] = result
+            if report:
+                report(case, n, result)
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'sizes': list(sizes),
+            'repeat': repeat,
+            'sample_time': sample_time,
+            'batch': BATCH,
+        },
+        'results': results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float,
+            min_time: float = 0.0, min_peak: int = 0) -> List[Dict[str, Any]]:
+    """Return one row per case and size present in both runs.
+    A row is a regression when time or peak memory grew by more than threshold
+    (0.1 means 10%); runs faster than min_time seconds or peaking below
+    min_peak bytes are too small for their ratios to count.
+    """
+    rows = []
+    for key, by_size in current['results'].items():
+        for size, result in by_size.items():
+            old = baseline['results'].get(key, {}).get(size)
+            if old is None:
+                continue
+            time_ratio = result['time'] / old['time'] if old['time'] else 1.0
+            peak_ratio = result['peak'] / old['peak'] if old['peak'] else 1.0
+            rows.append({
+                'case': key,
+                'size': int(size),
+                'time_ratio': time_ratio,
+                'peak_ratio': peak_ratio,
+                'regression': ((time_ratio > 1 + threshold and result['time'] >= min_time)
+                               or (peak_ratio > 1 + threshold and result['peak'] >= min_peak)),
+            })
+    return rows
+
+
+def recheck(current: Dict[str, Any], rows: List[Dict[str, Any]], repeat: int = DEFAULT_REPEAT,
+            sample_time: float = DEFAULT_SAMPLE_TIME,
+            report: Optional[Callable[[Case, int, Dict[str, float]], None]] = None) -> None:
+    """Measure the regression rows again, keeping the faster time and smaller peak.
+    A real slowdown persists across attempts; interference from other processes
+    usually does not, so compare() should be run again afterwards.
+    """
+    cases = {case.key: case for case in _cases()}
+    for row in rows:
+        if not row['regression']:
+            continue
+        result = current['results'][row['case']][str(row['size'])]
+        retry = measure(cases[row['case']], row['size'], repeat, sample_time)
+        result['time'] = min(result['time'], retry['time'])
+        result['peak'] = min(result['peak'], retry['peak'])
+        if report:
+            report(cases[row['case']], row['size'], result)
+
+
+def _format_time(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:9.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:9.2f} ms"
+    return f"{seconds:9.2f} s "
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ('B', 'KiB', 'MiB'):
+        if size < 1024:
+            return f"{size:8.1f} {unit:<3}"
+        size /= 1024
+    return f"{size:8.1f} GiB"
+
+
+def _print_result(case: Case, n: int, result: Dict[str, float]) -> None:
+    print(f"{case.group:<18}{case.name:<44}{n:>10}  "
+          f"{_format_time(result['time'])}  {_format_bytes(result['peak'])}", flush=True)
+
+
+def _size(text: str) -> int:
+    """Parse a size given as an integer or in scientific notation (1e6)."""
+    return int(float(text))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=_size, nargs='+', default=list(DEFAULT_SIZES),
+                        help='structure sizes to benchmark, e.g. 1e3 1e4 1e5 1e6 1e7')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='timed samples per case and size; the median is kept')
+    parser.add_argument('--sample-time', type=float, default=DEFAULT_SAMPLE_TIME,
+                        help='seconds of runs timed per sample; short runs are looped')
+    parser.add_argument('--filter', dest='pattern',
+                        help='only run cases whose "group/name" contains this text')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--baseline', help='JSON file from an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='relative slowdown or memory growth reported as a regression')
+    parser.add_argument('--min-time', type=float, default=1e-3,
+                        help='ignore slowdowns of runs faster than this many seconds')
+    parser.add_argument('--min-peak', type=int, default=64 * 1024,
+                        help='ignore memory growth of runs peaking below this many bytes')
+    parser.add_argument('--retries', type=int, default=2,
+                        help='times to re-measure regressions before reporting them')
+    args = parser.parse_args(argv)
+
+    print(f"{'group':<18}{'case':<44}{'n':>10}  {'time':>12}  {'peak memory':>12}")
+    print("-" * 100)
+    current = run_suite(args.sizes, args.repeat, args.pattern, _print_result,
+                        args.sample_time)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        rows = compare(current, baseline, args.threshold, args.min_time, args.min_peak)
+        for _ in range(args.retries):
+            if not any(row['regression'] for row in rows):
+                break
+            print("\nRe-measuring possible regressions")
+            recheck(current, rows, args.repeat, args.sample_time, _print_result)
+            rows = compare(current, baseline, args.threshold, args.min_time, args.min_peak)
+        regressions = [row for row in rows if row['regression']]
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(current, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if not args.baseline:
+        return 0
+    print(f"\nCompared {len(rows)} measurements against {args.baseline} "
+          f"(threshold {args.threshold:.0%})")
+    for row in regressions:
+        print(f"   REGRESSION {row['case']:<62} n={row['size']:<9} "
+              f"time x{row['time_ratio']:.2f}  memory x{row['peak_ratio']:.2f}")
+    if not regressions:
+        print("   No regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
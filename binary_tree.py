@@ -2,6 +2,11 @@
 Enhanced Binary Tree Implementation with Proper Error Handling
 """
 
+from collections import deque
+
+from numpy_ops import iter_elements, to_array
+
+
 class BinaryTree:
     """A binary tree implementation using linked nodes."""
     
@@ -220,6 +225,90 @@ class BinaryTree:
                 yield other
         yield p
     
+    def breadthfirst(self):
+        """Generate a breadth-first (level order) iteration of positions in the tree."""
+        if not self.is_empty():
+            fringe = deque([self.root()])
+            while fringe:
+                p = fringe.popleft()
+                yield p
+                for c in self.children(p):
+                    fringe.append(c)
+    
+    def _iter_elements(self, order, p=None):
+        """Generate the elements of the subtree rooted at p (default: whole tree)
+        in the given order, walking nodes directly.
+        """
+        start = self._root if p is None else self._validate(p)
+        if order == 'levelorder':
+            fringe = deque([start] if start is not None else [])
+            while fringe:
+                node = fringe.popleft()
+                yield node._data
+                if node._left is not None:
+                    fringe.append(node._left)
+                if node._right is not None:
+                    fringe.append(node._right)
+        elif order == 'inorder':
+            stack = []
+            node = start
+            while stack or node is not None:
+                while node is not None:
+                    stack.append(node)
+                    node = node._left
+                node = stack.pop()
+                yield node._data
+                node = node._right
+        else:
+            raise ValueError("order must be 'levelorder' or 'inorder'")
+    
+    def to_numpy(self, dtype=None, order='levelorder'):
+        """Return the elements as a NumPy array in level order or inorder."""
+        return to_array(self._iter_elements(order), self._size, dtype)
+    
+    @classmethod
+    def from_numpy(cls, arr, order='levelorder'):
+        """Build a tree from a 1-D NumPy array.
+        With order='levelorder' the array is read as a complete tree in level
+        order; with order='inorder' a height-balanced tree is built whose
+        inorder traversal reproduces the array.
+        """
+        tree = cls()
+        if order == 'levelorder':
+            parents = deque()
+            for e in iter_elements(arr):
+                node = cls._Node(e)
+                if tree._root is None:
+                    tree._root = node
+                else:
+                    parent = parents[0]
+                    node._parent = parent
+                    if parent._left is None:
+                        parent._left = node
+                    else:
+                        parent._right = node
+                        parents.popleft()
+                parents.append(node)
+                tree._size += 1
+        elif order == 'inorder':
+            elements = iter_elements(arr)
+            
+            def build(count, parent):
+                """Build a balanced subtree from the next count elements."""
+                if count == 0:
+                    return None
+                node = cls._Node(None, parent=parent)
+                node._left = build((count - 1) // 2, node)
+                node._data = next(elements)
+                node._right = build(count - 1 - (count - 1) // 2, node)
+                return node
+            
+            tree._root = build(len(arr), None)
+            tree._size = len(arr)
+        else:
+            raise ValueError("order must be 'levelorder' or 'inorder'")
+        return tree
+    
     def children(self, p):
         """Generate an iteration of Positions representing p's children."""
         if self.left(p) is not None:
@@ -274,4 +363,8 @@ if __name__ == "__main__":
     print("\n\nPostorder traversal:")
     for pos in tree.postorder():
         print(pos.element(), end=" ")
+    
+    print("\n\nBreadth-first traversal:")
+    for pos in tree.breadthfirst():
+        print(pos.element(), end=" ")
     print()
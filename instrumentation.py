@@ -0,0 +1,289 @@
+"""
+Opt-in Hot-Path Instrumentation for Linked Lists and Binary Trees
+
+enable() swaps the traced methods for timing wrappers and disable() puts the
+original functions back, so while instrumentation is off the classes run
+exactly the code they would without this module.  For each traced operation
+the wrappers record call counts, nodes traversed, Positions allocated and wall
+time.  Where a loop's length follows exactly from the arguments, the result
+and the size of the structure, nodes traversed are computed from those, so the
+traversal loops themselves carry no counters.  Otherwise a counter is read:
+BinaryTree.height visits each node through exactly one is_leaf call, which is
+counted while enabled, and delete_by_value's scan (_remove_first) reports the
+index it stopped at.  No operation is ever re-walked to find its count.
+"""
+
+import inspect
+import logging
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from binary_tree import BinaryTree
+from linked_lists import CircularLinkedList, DoublyLinkedList, SinglyLinkedList
+
+
+def _found(index: int, size: int) -> int:
+    """Nodes visited by a forward scan that stopped at index (-1: not found)."""
+    return index + 1 if index >= 0 else size
+
+
+def _before(index: int, size: int) -> int:
+    """Nodes visited walking to just before index; the ends are reached in O(1)."""
+    return index if 0 < index < size else 0
+
+
+def _nearer_end(index: int, size: int) -> int:
+    """Nodes visited by DoublyLinkedList._node_at(index)."""
+    if index >= size:
+        return 0
+    return index + 1 if index < size // 2 else size - index
+
+
+# class -> {method name: nodes-traversed count}
+_OPERATIONS = {
+    SinglyLinkedList: {
+        'insert_at_end': lambda c: 0,
+        'insert_at_position': lambda c: _before(c.args['position'], c.size),
+        'delete_from_end': lambda c: c.size,
+        'delete_from_position': lambda c: c.args['position'] + 1,
+        'delete_by_value': lambda c: c.nodes,
+        'search': lambda c: _found(c.result, c.size),
+        'get': lambda c: c.args['index'] + 1,
+        'get_middle': lambda c: c.size // 2 + 1 if c.size else 0,
+        'reverse': lambda c: c.size,
+        'remove_duplicates': lambda c: c.size,
+        'concat': lambda c: 0,
+        'splice': lambda c: _before(c.args['position'], c.size),
+        'split_at': lambda c: _before(c.args['index'], c.size),
+    },
+    DoublyLinkedList: {
+        'reverse': lambda c: c.size,
+        'concat': lambda c: 0,
+        'splice': lambda c: _nearer_end(c.args['position'], c.size),
+        'split_at': lambda c: _nearer_end(c.args['index'], c.size),
+    },
+    CircularLinkedList: {
+        'insert_at_beginning': lambda c: 0,
+        'insert_at_end': lambda c: 0,
+        'delete_from_beginning': lambda c: 0,
+        'concat': lambda c: 0,
+        'splice': lambda c: _before(c.args['position'], c.size),
+        'split_at': lambda c: _before(c.args['index'], c.size),
+    },
+    BinaryTree: {
+        'depth': lambda c: c.result + 1,
+        'height': lambda c: c.nodes,
+    },
+}
+
+
+# Methods called exactly once per node visited by a traced operation
+_PROBES = {
+    BinaryTree: ('is_leaf',),
+}
+
+
+class _ThreadState(threading.local):
+    """Per-thread nesting level and running counts of nodes and Positions."""
+    depth = 0
+    nodes = 0
+    positions = 0
+
+
+logger = logging.getLogger(__name__)
+
+_state = _ThreadState()
+_lock = threading.Lock()
+_stats: Dict[str, Dict[str, Any]] = {}
+_originals: Dict[tuple, Callable] = {}
+_enabled = 0
+_hook: Optional[Callable[[str, int, int, float], None]] = None
+
+
+def _record(label: str, nodes: int, positions: int, elapsed: float) -> None:
+    """Accumulate one completed call into the stats and notify the hook."""
+    with _lock:
+        entry = _stats.get(label)
+        if entry is None:
+            entry = _stats[label] = {'calls': 0, 'nodes': 0, 'max_nodes': 0,
+                                     'positions': 0, 'time': 0.0}
+        entry['calls'] += 1
+        entry['nodes'] += nodes
+        entry['max_nodes'] = max(entry['max_nodes'], nodes)
+        entry['positions'] += positions
+        entry['time'] += elapsed
+    hook = _hook
+    if hook is not None:
+        # The operation has already completed; a failing metrics hook must not
+        # turn it into an exception for the caller
+        try:
+            hook(label, nodes, positions, elapsed)
+        except Exception:
+            logger.exception("instrumentation hook failed for %s", label)
+
+
+def _traced(cls: type, name: str, original: Callable, steps: Callable) -> Callable:
+    """Return a wrapper around original that records each outermost call."""
+    label = f"{cls.__name__}.{name}"
+    signature = inspect.signature(original)
+
+    @wraps(original)
+    def wrapper(obj, *args, **kwargs):
+        if _state.depth:
+            # Nested call (recursion or one traced method using another)
+            return original(obj, *args, **kwargs)
+        bound = signature.bind(obj, *args, **kwargs)
+        bound.apply_defaults()
+        call = SimpleNamespace(obj=obj, args=bound.arguments, size=len(obj),
+                               result=None, nodes=0)
+        _state.depth = 1
+        _state.nodes = 0
+        try:
+            positions = _state.positions
+            start = perf_counter()
+            call.result = original(obj, *args, **kwargs)
+            elapsed = perf_counter() - start
+            call.nodes = _state.nodes
+        finally:
+            _state.depth = 0
+        _record(label, steps(call), _state.positions - positions, elapsed)
+        return call.result
+
+    return wrapper
+
+
+def _probe(original: Callable) -> Callable:
+    """Return a wrapper around original that counts one node visit per call."""
+    @wraps(original)
+    def wrapper(*args, **kwargs):
+        _state.nodes += 1
+        return original(*args, **kwargs)
+    return wrapper
+
+
+def _counting_remove_first(original: Callable) -> Callable:
+    """Return a wrapper around SinglyLinkedList._remove_first that counts the
+    nodes its scan compared, derived from the index it stopped at.
+    """
+    @wraps(original)
+    def wrapper(self, value):
+        size = self._size
+        index = original(self, value)
+        _state.nodes += _found(index, size)
+        return index
+    return wrapper
+
+
+def _counting_make_position(original: Callable) -> Callable:
+    """Return a wrapper around BinaryTree._make_position that counts Positions."""
+    @wraps(original)
+    def wrapper(self, node):
+        if node is not None:
+            _state.positions += 1
+        return original(self, node)
+    return wrapper
+
+
+def is_enabled() -> bool:
+    """Return True if instrumentation is currently installed."""
+    return _enabled > 0
+
+
+def _install(cls: type, name: str, replacement: Callable) -> None:
+    """Replace cls.name, remembering the original for disable()."""
+    _originals[cls, name] = cls.__dict__[name]
+    setattr(cls, name, replacement)
+
+
+def enable() -> None:
+    """Install the instrumentation wrappers.
+    Calls nest: the wrappers stay installed until disable() has been called
+    once for every enable().
+    """
+    global _enabled
+    with _lock:
+        _enabled += 1
+        if _enabled > 1:
+            return
+        for cls, operations in _OPERATIONS.items():
+            for name, steps in operations.items():
+                _install(cls, name, _traced(cls, name, cls.__dict__[name], steps))
+        for cls, names in _PROBES.items():
+            for name in names:
+                _install(cls, name, _probe(cls.__dict__[name]))
+        _install(SinglyLinkedList, '_remove_first',
+                 _counting_remove_first(SinglyLinkedList.__dict__['_remove_first']))
+        _install(BinaryTree, '_make_position',
+                 _counting_make_position(BinaryTree.__dict__['_make_position']))
+
+
+def disable() -> None:
+    """Undo one enable(); the original methods return after the last one."""
+    global _enabled
+    with _lock:
+        if _enabled == 0:
+            return
+        _enabled -= 1
+        if _enabled:
+            return
+        while _originals:
+            (cls, name), original = _originals.popitem()
+            setattr(cls, name, original)
+
+
+@contextmanager
+def instrumented() -> Iterator[None]:
+    """Enable instrumentation for the duration of a with block."""
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+
+
+def set_hook(hook: Optional[Callable[[str, int, int, float], None]]) -> None:
+    """Install hook(operation, nodes, positions, seconds), called after every
+    recorded call; pass None to remove it.  Exceptions raised by the hook are
+    logged and never reach the caller of the traced operation.
+    """
+    global _hook
+    _hook = hook
+
+
+def stats() -> Dict[str, Dict[str, Any]]:
+    """Return a snapshot of the per-operation counters recorded so far."""
+    with _lock:
+        return {label: dict(entry) for label, entry in _stats.items()}
+
+
+def reset() -> None:
+    """Discard all recorded counters."""
+    with _lock:
+        _stats.clear()
+
+
+# Example usage and tests
+if __name__ == "__main__":
+    with instrumented():
+        sll = SinglyLinkedList()
+        for i in range(100):
+            sll.insert_at_end(i)
+        sll.get(50)
+        sll.search(75)
+        sll.delete_by_value(99)
+
+        tree = BinaryTree()
+        root = tree.add_root(1)
+        left = tree.add_left(root, 2)
+        leaf = tree.add_left(left, 3)
+        tree.depth(leaf)
+        tree.height()
+
+    print(f"{'operation':<32}{'calls':>7}{'nodes':>8}{'max':>6}{'positions':>11}{'ms':>10}")
+    for label, entry in sorted(stats().items()):
+        print(f"{label:<32}{entry['calls']:>7}{entry['nodes']:>8}{entry['max_nodes']:>6}"
+              f"{entry['positions']:>11}{entry['time'] * 1e3:>10.3f}")
@@ -2,8 +2,11 @@
 Enhanced Linked List Implementations with Type Hints and Advanced Features
 """
 
-from typing import Optional, Any, Iterator, List
+from typing import Optional, Any, Callable, Iterable, Iterator, List, Tuple, Union
 from dataclasses import dataclass
+from itertools import islice
+
+from numpy_ops import iter_elements, to_array
 
 
 @dataclass
@@ -27,11 +30,150 @@ class DNode:
         return f"DNode({self.data})"
 
 
+@dataclass(frozen=True, eq=False)
+class PNode:
+    """Immutable node class for persistent linked list.
+    Nodes are shared between versions, so they compare and hash by identity.
+    """
+    data: Any
+    next: Optional['PNode'] = None
+    
+    def __repr__(self) -> str:
+        return f"PNode({self.data})"
+
+
+# Longest prefix shown by __str__/__repr__ before the rest is elided
+_MAX_REPR_ITEMS = 100
+
+
+def _preview(values: Iterable[Any], size: int, separator: str = ", ") -> str:
+    """Join the str() of at most _MAX_REPR_ITEMS values, eliding the rest."""
+    shown = [str(data) for data in islice(values, _MAX_REPR_ITEMS)]
+    if size > _MAX_REPR_ITEMS:
+        shown.append(f"... ({size - _MAX_REPR_ITEMS} more)")
+    return separator.join(shown)
+
+
+def _normalize_index(index: int, size: int) -> int:
+    """Return index as a non-negative position, supporting negative indexing."""
+    position = index + size if index < 0 else index
+    if position < 0 or position >= size:
+        raise IndexError(f"Index {index} out of bounds. List size: {size}")
+    return position
+
+
+class Stream:
+    """Lazy generator pipeline over an iterable.
+    
+    Stages are recorded rather than applied: every iteration rebuilds the chain
+    of generators from the source, so nothing is copied, elements are only
+    pulled as the stream is consumed, and a stream over a list can be consumed
+    any number of times.
+    """
+    
+    def __init__(self, source: Iterable[Any],
+                 stages: Tuple[Callable[[Iterator[Any]], Iterator[Any]], ...] = ()) -> None:
+        self._source = source
+        self._stages = stages
+    
+    def _then(self, stage: Callable[[Iterator[Any]], Iterator[Any]]) -> 'Stream':
+        """Return a new stream with stage appended to the pipeline."""
+        return Stream(self._source, self._stages + (stage,))
+    
+    def filter(self, predicate: Callable[[Any], bool]) -> 'Stream':
+        """Keep only the elements for which predicate returns True."""
+        return self._then(lambda it: filter(predicate, it))
+    
+    def map(self, func: Callable[[Any], Any]) -> 'Stream':
+        """Apply func to every element."""
+        return self._then(lambda it: map(func, it))
+    
+    def skip(self, n: int) -> 'Stream':
+        """Drop the first n elements."""
+        return self._then(lambda it: islice(it, n, None))
+    
+    def take(self, n: int) -> 'Stream':
+        """Stop after the first n elements."""
+        return self._then(lambda it: islice(it, n))
+    
+    def first(self, default: Any = None) -> Any:
+        """Return the first element, or default if the stream is empty."""
+        return next(iter(self), default)
+    
+    def to_list(self) -> List[Any]:
+        """Consume the stream into a Python list."""
+        return list(self)
+    
+    def __iter__(self) -> Iterator[Any]:
+        it = iter(self._source)
+        for stage in self._stages:
+            it = stage(it)
+        return it
+
+
+class LinkedListView:
+    """Lazy read-only view of a slice of a linked list.
+    
+    No elements are copied; the slice is resolved against the source each time
+    the view is iterated, so it reflects later changes to the list.
+    """
+    
+    def __init__(self, source: Any, index: slice) -> None:
+        self._source = source
+        self._slice = index
+    
+    def _range(self) -> range:
+        """Return the source indices selected by the slice."""
+        return range(*self._slice.indices(len(self._source)))
+    
+    def __len__(self) -> int:
+        return len(self._range())
+    
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        selected = self._range()
+        if isinstance(index, slice):
+            selected = selected[index]
+            if not selected:
+                return LinkedListView(self._source, slice(0, 0))
+            stop = selected.stop if selected.stop >= 0 else None
+            return LinkedListView(self._source, slice(selected.start, stop, selected.step))
+        return self._source[selected[_normalize_index(index, len(selected))]]
+    
+    def __iter__(self) -> Iterator[Any]:
+        selected = self._range()
+        if not selected:
+            return
+        if selected.step > 0:
+            yield from islice(self._source, selected.start, selected.stop, selected.step)
+        elif hasattr(self._source, '__reversed__'):
+            # Walk backwards from the tail; index i is at reversed position n-1-i
+            last = len(self._source) - 1
+            yield from islice(reversed(self._source), last - selected.start,
+                              last - selected.stop, -selected.step)
+        else:
+            # No backward links: collect only the selected elements, then reverse
+            forward = selected[::-1]
+            yield from reversed(list(islice(self._source, forward.start,
+                                            forward.stop, forward.step)))
+    
+    def stream(self) -> Stream:
+        """Return a lazy pipeline over the view."""
+        return Stream(self)
+    
+    def to_list(self) -> List[Any]:
+        """Convert the view to a Python list."""
+        return list(self)
+    
+    def __repr__(self) -> str:
+        return f"LinkedListView([{_preview(self, len(self))}])"
+
+
 class SinglyLinkedList:
     """Enhanced Singly Linked List with comprehensive operations."""
     
     def __init__(self) -> None:
         self.head: Optional[Node] = None
+        self.tail: Optional[Node] = None
         self._size: int = 0
     
     def __len__(self) -> int:
@@ -45,21 +187,19 @@ class SinglyLinkedList:
     def insert_at_beginning(self, data: Any) -> None:
         """Insert a new node at the beginning. O(1) time complexity."""
         new_node = Node(data, self.head)
+        if not self.head:
+            self.tail = new_node
         self.head = new_node
         self._size += 1
     
     def insert_at_end(self, data: Any) -> None:
-        """Insert a new node at the end. O(n) time complexity."""
+        """Insert a new node at the end. O(1) time complexity (using tail pointer)."""
         new_node = Node(data)
-        if not self.head:
+        if self.tail:
+            self.tail.next = new_node
+        else:
             self.head = new_node
-            self._size += 1
-            return
-        
-        last_node = self.head
-        while last_node.next:
-            last_node = last_node.next
-        last_node.next = new_node
+        self.tail = new_node
         self._size += 1
     
     def insert_at_position(self, data: Any, position: int) -> None:
@@ -70,6 +210,9 @@ class SinglyLinkedList:
         if position == 0:
             self.insert_at_beginning(data)
             return
+        if position == self._size:
+            self.insert_at_end(data)
+            return
         
         new_node = Node(data)
         current = self.head
@@ -87,6 +230,8 @@ class SinglyLinkedList:
         
         data = self.head.data
         self.head = self.head.next
+        if not self.head:
+            self.tail = None
         self._size -= 1
         return data
     
@@ -97,7 +242,7 @@ class SinglyLinkedList:
         
         if not self.head.next:
             data = self.head.data
-            self.head = None
+            self.head = self.tail = None
             self._size -= 1
             return data
         
@@ -107,6 +252,7 @@ class SinglyLinkedList:
         
         data = second_last.next.data
         second_last.next = None
+        self.tail = second_last
         self._size -= 1
         return data
     
@@ -124,28 +270,40 @@ class SinglyLinkedList:
         
         data = current.next.data
         current.next = current.next.next
+        if not current.next:
+            self.tail = current
         self._size -= 1
         return data
     
     def delete_by_value(self, value: Any) -> bool:
         """Delete the first node with the specified value. Returns True if found."""
+        return self._remove_first(value) >= 0
+    
+    def _remove_first(self, value: Any) -> int:
+        """Unlink the first node holding value; return its index, or -1 if absent."""
         if not self.head:
-            return False
+            return -1
         
         if self.head.data == value:
             self.head = self.head.next
+            if not self.head:
+                self.tail = None
             self._size -= 1
-            return True
+            return 0
         
         current = self.head
+        index = 1
         while current.next:
             if current.next.data == value:
                 current.next = current.next.next
+                if not current.next:
+                    self.tail = current
                 self._size -= 1
-                return True
+                return index
             current = current.next
+            index += 1
         
-        return False
+        return -1
     
     def search(self, value: Any) -> int:
         """Return the index of the first occurrence of value, or -1 if not found."""
@@ -171,7 +329,7 @@ class SinglyLinkedList:
     def reverse(self) -> None:
         """Reverse the linked list in-place. O(n) time complexity."""
         prev = None
-        current = self.head
+        current = self.tail = self.head
         while current:
             next_node = current.next
             current.next = prev
@@ -209,6 +367,91 @@ class SinglyLinkedList:
                 self._size -= 1
             else:
                 current = current.next
+        self.tail = current
+    
+    def concat(self, other: 'SinglyLinkedList') -> None:
+        """Append all nodes of other to this list, leaving other empty.
+        O(1) time complexity (using tail pointer); no nodes are copied.
+        """
+        if type(other) is not type(self):
+            raise TypeError('List types must match')
+        if other is self:
+            raise ValueError('Cannot concatenate a list with itself')
+        if not other.head:
+            return
+        
+        if self.tail:
+            self.tail.next = other.head
+        else:
+            self.head = other.head
+        self.tail = other.tail
+        self._size += other._size
+        other.head = other.tail = None
+        other._size = 0
+    
+    def splice(self, position: int, other: 'SinglyLinkedList') -> None:
+        """Move all nodes of other into this list before the given position.
+        O(position) time complexity, O(1) at either end; no nodes are copied.
+        """
+        if type(other) is not type(self):
+            raise TypeError('List types must match')
+        if other is self:
+            raise ValueError('Cannot splice a list into itself')
+        if position < 0 or position > self._size:
+            raise IndexError(f"Position {position} out of bounds. List size: {self._size}")
+        if not other.head:
+            return
+        if position == self._size:
+            self.concat(other)
+            return
+        
+        if position == 0:
+            other.tail.next = self.head
+            self.head = other.head
+        else:
+            current = self.head
+            for _ in range(position - 1):
+                current = current.next
+            other.tail.next = current.next
+            current.next = other.head
+        self._size += other._size
+        other.head = other.tail = None
+        other._size = 0
+    
+    def split_at(self, index: int) -> 'SinglyLinkedList':
+        """Detach the nodes from index onwards and return them as a new list.
+        O(index) time complexity, O(1) at either end; no nodes are copied.
+        """
+        if index < 0 or index > self._size:
+            raise IndexError(f"Index {index} out of bounds. List size: {self._size}")
+        
+        result = type(self)()
+        if index == self._size:
+            return result
+        
+        result.tail = self.tail
+        if index == 0:
+            result.head = self.head
+            self.head = self.tail = None
+        else:
+            current = self.head
+            for _ in range(index - 1):
+                current = current.next
+            result.head, current.next = current.next, None
+            self.tail = current
+        result._size = self._size - index
+        self._size = index
+        return result
+    
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """Return the element at index, or a lazy LinkedListView for a slice."""
+        if isinstance(index, slice):
+            return LinkedListView(self, index)
+        return self.get(_normalize_index(index, self._size))
+    
+    def stream(self) -> Stream:
+        """Return a lazy pipeline over the list that never copies the chain."""
+        return Stream(self)
     
     def to_list(self) -> List[Any]:
         """Convert linked list to Python list."""
@@ -219,6 +462,21 @@ class SinglyLinkedList:
             current = current.next
         return result
     
+    def to_numpy(self, dtype: Any = None) -> Any:
+        """Convert linked list to a NumPy array without an intermediate Python list."""
+        return to_array(self, self._size, dtype)
+    
+    @classmethod
+    def from_numpy(cls, arr: Any) -> 'SinglyLinkedList':
+        """Build a linked list from the elements of a 1-D NumPy array."""
+        result = cls()
+        for data in iter_elements(arr, reverse=True):
+            result.head = Node(data, result.head)
+            if not result.tail:
+                result.tail = result.head
+            result._size += 1
+        return result
+    
     def __iter__(self) -> Iterator[Any]:
         """Make the linked list iterable."""
         current = self.head
@@ -230,10 +488,10 @@ class SinglyLinkedList:
         """String representation of the linked list."""
         if not self.head:
             return "None"
-        return " -> ".join(str(data) for data in self) + " -> None"
+        return _preview(self, self._size, " -> ") + " -> None"
     
     def __repr__(self) -> str:
-        return f"SinglyLinkedList([{', '.join(str(data) for data in self)}])"
+        return f"SinglyLinkedList([{_preview(self, self._size)}])"
 
 
 class DoublyLinkedList:
@@ -307,6 +565,113 @@ class DoublyLinkedList:
             current.prev, current.next = current.next, current.prev
             current = current.prev
     
+    def _node_at(self, index: int) -> DNode:
+        """Return the node at index, walking from whichever end is closer."""
+        if index < self._size // 2:
+            current = self.head
+            for _ in range(index):
+                current = current.next
+        else:
+            current = self.tail
+            for _ in range(self._size - 1 - index):
+                current = current.prev
+        return current
+    
+    def concat(self, other: 'DoublyLinkedList') -> None:
+        """Append all nodes of other to this list, leaving other empty.
+        O(1) time complexity; no nodes are copied.
+        """
+        if type(other) is not type(self):
+            raise TypeError('List types must match')
+        if other is self:
+            raise ValueError('Cannot concatenate a list with itself')
+        if not other.head:
+            return
+        
+        if self.tail:
+            self.tail.next = other.head
+            other.head.prev = self.tail
+        else:
+            self.head = other.head
+        self.tail = other.tail
+        self._size += other._size
+        other.head = other.tail = None
+        other._size = 0
+    
+    def splice(self, position: int, other: 'DoublyLinkedList') -> None:
+        """Move all nodes of other into this list before the given position.
+        O(min(position, n - position)) time complexity; no nodes are copied.
+        """
+        if type(other) is not type(self):
+            raise TypeError('List types must match')
+        if other is self:
+            raise ValueError('Cannot splice a list into itself')
+        if position < 0 or position > self._size:
+            raise IndexError(f"Position {position} out of bounds. List size: {self._size}")
+        if not other.head:
+            return
+        if position == self._size:
+            self.concat(other)
+            return
+        
+        successor = self._node_at(position)
+        predecessor = successor.prev
+        other.tail.next = successor
+        successor.prev = other.tail
+        other.head.prev = predecessor
+        if predecessor:
+            predecessor.next = other.head
+        else:
+            self.head = other.head
+        self._size += other._size
+        other.head = other.tail = None
+        other._size = 0
+    
+    def split_at(self, index: int) -> 'DoublyLinkedList':
+        """Detach the nodes from index onwards and return them as a new list.
+        O(min(index, n - index)) time complexity; no nodes are copied.
+        """
+        if index < 0 or index > self._size:
+            raise IndexError(f"Index {index} out of bounds. List size: {self._size}")
+        
+        result = type(self)()
+        if index == self._size:
+            return result
+        
+        first = self._node_at(index)
+        result.head, result.tail = first, self.tail
+        result._size = self._size - index
+        self.tail = first.prev
+        if self.tail:
+            self.tail.next = None
+        else:
+            self.head = None
+        first.prev = None
+        self._size = index
+        return result
+    
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """Return the element at index, or a lazy LinkedListView for a slice."""
+        if isinstance(index, slice):
+            return LinkedListView(self, index)
+        return self._node_at(_normalize_index(index, self._size)).data
+    
+    def stream(self) -> Stream:
+        """Return a lazy pipeline over the list that never copies the chain."""
+        return Stream(self)
+    
+    def to_numpy(self, dtype: Any = None) -> Any:
+        """Convert linked list to a NumPy array without an intermediate Python list."""
+        return to_array(self, self._size, dtype)
+    
+    @classmethod
+    def from_numpy(cls, arr: Any) -> 'DoublyLinkedList':
+        """Build a linked list from the elements of a 1-D NumPy array."""
+        result = cls()
+        for data in iter_elements(arr):
+            result.insert_at_end(data)
+        return result
+    
     def __iter__(self) -> Iterator[Any]:
         current = self.head
         while current:
@@ -323,10 +688,10 @@ class DoublyLinkedList:
     def __str__(self) -> str:
         if not self.head:
             return "None"
-        return "None <-> " + " <-> ".join(str(data) for data in self) + " <-> None"
+        return "None <-> " + _preview(self, self._size, " <-> ") + " <-> None"
     
     def __repr__(self) -> str:
-        return f"DoublyLinkedList([{', '.join(str(data) for data in self)}])"
+        return f"DoublyLinkedList([{_preview(self, self._size)}])"
 
 
 class CircularLinkedList:
@@ -334,6 +699,7 @@ class CircularLinkedList:
     
     def __init__(self) -> None:
         self.head: Optional[Node] = None
+        self.tail: Optional[Node] = None
         self._size: int = 0
     
     def __len__(self) -> int:
@@ -343,52 +709,150 @@ class CircularLinkedList:
         return self.head is None
     
     def insert_at_beginning(self, data: Any) -> None:
-        """Insert at the beginning of circular list."""
+        """Insert at the beginning of circular list. O(1) time complexity (using tail pointer)."""
         new_node = Node(data)
         if not self.head:
             new_node.next = new_node
-            self.head = new_node
+            self.tail = new_node
         else:
-            # Find last node
-            last = self.head
-            while last.next != self.head:
-                last = last.next
             new_node.next = self.head
-            last.next = new_node
-            self.head = new_node
+            self.tail.next = new_node
+        self.head = new_node
         self._size += 1
     
     def insert_at_end(self, data: Any) -> None:
-        """Insert at the end of circular list."""
+        """Insert at the end of circular list. O(1) time complexity (using tail pointer)."""
         new_node = Node(data)
         if not self.head:
             new_node.next = new_node
             self.head = new_node
         else:
-            last = self.head
-            while last.next != self.head:
-                last = last.next
-            last.next = new_node
             new_node.next = self.head
+            self.tail.next = new_node
+        self.tail = new_node
         self._size += 1
     
     def delete_from_beginning(self) -> Optional[Any]:
-        """Delete from the beginning of circular list."""
+        """Delete from the beginning of circular list. O(1) time complexity."""
         if not self.head:
             raise IndexError("Cannot delete from empty list")
         
         data = self.head.data
-        if self.head.next == self.head:
-            self.head = None
+        if self.head is self.tail:
+            self.head = self.tail = None
         else:
-            last = self.head
-            while last.next != self.head:
-                last = last.next
-            last.next = self.head.next
             self.head = self.head.next
+            self.tail.next = self.head
         self._size -= 1
         return data
     
+    def concat(self, other: 'CircularLinkedList') -> None:
+        """Append all nodes of other to this list, leaving other empty.
+        O(1) time complexity (using tail pointer); no nodes are copied.
+        """
+        if type(other) is not type(self):
+            raise TypeError('List types must match')
+        if other is self:
+            raise ValueError('Cannot concatenate a list with itself')
+        if not other.head:
+            return
+        
+        if self.tail:
+            self.tail.next = other.head
+            other.tail.next = self.head
+        else:
+            self.head = other.head
+        self.tail = other.tail
+        self._size += other._size
+        other.head = other.tail = None
+        other._size = 0
+    
+    def splice(self, position: int, other: 'CircularLinkedList') -> None:
+        """Move all nodes of other into this list before the given position.
+        O(position) time complexity, O(1) at either end; no nodes are copied.
+        """
+        if type(other) is not type(self):
+            raise TypeError('List types must match')
+        if other is self:
+            raise ValueError('Cannot splice a list into itself')
+        if position < 0 or position > self._size:
+            raise IndexError(f"Position {position} out of bounds. List size: {self._size}")
+        if not other.head:
+            return
+        if position == self._size:
+            self.concat(other)
+            return
+        
+        current = self.tail
+        for _ in range(position):
+            current = current.next
+        other.tail.next = current.next
+        current.next = other.head
+        if position == 0:
+            self.head = other.head
+        self._size += other._size
+        other.head = other.tail = None
+        other._size = 0
+    
+    def split_at(self, index: int) -> 'CircularLinkedList':
+        """Detach the nodes from index onwards and return them as a new circular list.
+        O(index) time complexity, O(1) at either end; no nodes are copied.
+        """
+        if index < 0 or index > self._size:
+            raise IndexError(f"Index {index} out of bounds. List size: {self._size}")
+        
+        result = type(self)()
+        if index == self._size:
+            return result
+        
+        result.tail = self.tail
+        if index == 0:
+            result.head = self.head
+            self.head = self.tail = None
+        else:
+            current = self.head
+            for _ in range(index - 1):
+                current = current.next
+            result.head = current.next
+            result.tail.next = result.head
+            current.next = self.head
+            self.tail = current
+        result._size = self._size - index
+        self._size = index
+        return result
+    
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """Return the element at index, or a lazy LinkedListView for a slice."""
+        if isinstance(index, slice):
+            return LinkedListView(self, index)
+        return next(islice(self, _normalize_index(index, self._size), None))
+    
+    def stream(self) -> Stream:
+        """Return a lazy pipeline over the list that never copies the chain."""
+        return Stream(self)
+    
+    def to_numpy(self, dtype: Any = None) -> Any:
+        """Convert linked list to a NumPy array without an intermediate Python list."""
+        return to_array(self, self._size, dtype)
+    
+    @classmethod
+    def from_numpy(cls, arr: Any) -> 'CircularLinkedList':
+        """Build a circular list from the elements of a 1-D NumPy array. O(n) overall."""
+        result = cls()
+        last = None
+        for data in iter_elements(arr):
+            new_node = Node(data)
+            if last:
+                last.next = new_node
+            else:
+                result.head = new_node
+            last = new_node
+            result._size += 1
+        if last:
+            last.next = result.head
+        result.tail = last
+        return result
+    
     def __iter__(self) -> Iterator[Any]:
         if not self.head:
             return
@@ -402,8 +866,134 @@ class CircularLinkedList:
     def __str__(self) -> str:
         if not self.head:
             return "None"
-        elements = list(self)
-        return " -> ".join(str(e) for e in elements) + f" -> {elements[0]} (circular)"
+        return _preview(self, self._size, " -> ") + f" -> {self.head.data} (circular)"
+    
+    def __repr__(self) -> str:
+        return f"CircularLinkedList([{_preview(self, self._size)}])"
+
+
+class PersistentLinkedList:
+    """Immutable singly linked list whose versions share nodes.
+    
+    Every "modifying" operation returns a new list and leaves the original
+    untouched, so a reference to a list is a consistent snapshot that can be
+    iterated without copying or locking while writers publish new versions.
+    """
+    
+    def __init__(self, iterable: Iterable[Any] = ()) -> None:
+        head = None
+        size = 0
+        for data in reversed(list(iterable)):
+            head = PNode(data, head)
+            size += 1
+        self._head: Optional[PNode] = head
+        self._size: int = size
+    
+    @classmethod
+    def _from_node(cls, head: Optional[PNode], size: int) -> 'PersistentLinkedList':
+        """Return a list sharing the chain starting at head. O(1) time complexity."""
+        result = cls.__new__(cls)
+        result._head = head
+        result._size = size
+        return result
+    
+    @property
+    def head(self) -> Optional[PNode]:
+        """Return the first node of the list (or None if empty)."""
+        return self._head
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def is_empty(self) -> bool:
+        return self._head is None
+    
+    def first(self) -> Any:
+        """Return the first element. O(1) time complexity."""
+        if not self._head:
+            raise IndexError("Cannot read from empty list")
+        return self._head.data
+    
+    def prepend(self, data: Any) -> 'PersistentLinkedList':
+        """Return a new list with data in front of this one. O(1) time complexity."""
+        return self._from_node(PNode(data, self._head), self._size + 1)
+    
+    def tail(self) -> 'PersistentLinkedList':
+        """Return the list without its first element. O(1) time complexity."""
+        if not self._head:
+            raise IndexError("Cannot take the tail of an empty list")
+        return self._from_node(self._head.next, self._size - 1)
+    
+    def reverse(self) -> 'PersistentLinkedList':
+        """Return a reversed copy of the list. O(n) time complexity."""
+        head = None
+        current = self._head
+        while current:
+            head = PNode(current.data, head)
+            current = current.next
+        return self._from_node(head, self._size)
+    
+    def merge_sorted(self, other: 'PersistentLinkedList') -> 'PersistentLinkedList':
+        """Merge two sorted lists into a new sorted list.
+        Only the merged prefix is copied; the remaining suffix of whichever
+        list outlasts the other is shared with the result.
+        """
+        prefix = []
+        p, q = self._head, other._head
+        while p and q:
+            if p.data <= q.data:
+                prefix.append(p.data)
+                p = p.next
+            else:
+                prefix.append(q.data)
+                q = q.next
+        
+        head = p or q
+        for data in reversed(prefix):
+            head = PNode(data, head)
+        return self._from_node(head, self._size + other._size)
+    
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """Return the element at index, or a lazy LinkedListView for a slice."""
+        if isinstance(index, slice):
+            return LinkedListView(self, index)
+        return next(islice(self, _normalize_index(index, self._size), None))
+    
+    def stream(self) -> Stream:
+        """Return a lazy pipeline over the list that never copies the chain."""
+        return Stream(self)
+    
+    def to_list(self) -> List[Any]:
+        """Convert linked list to Python list."""
+        return list(self)
+    
+    def to_numpy(self, dtype: Any = None) -> Any:
+        """Convert linked list to a NumPy array without an intermediate Python list."""
+        return to_array(self, self._size, dtype)
+    
+    @classmethod
+    def from_numpy(cls, arr: Any) -> 'PersistentLinkedList':
+        """Build a persistent list from the elements of a 1-D NumPy array."""
+        head = None
+        size = 0
+        for data in iter_elements(arr, reverse=True):
+            head = PNode(data, head)
+            size += 1
+        return cls._from_node(head, size)
+    
+    def __iter__(self) -> Iterator[Any]:
+        current = self._head
+        while current:
+            yield current.data
+            current = current.next
+    
+    def __str__(self) -> str:
+        if not self._head:
+            return "None"
+        return _preview(self, self._size, " -> ") + " -> None"
+    
+    def __repr__(self) -> str:
+        return f"PersistentLinkedList([{_preview(self, self._size)}])"
 
 
 def merge_sorted_lists(list1: SinglyLinkedList, list2: SinglyLinkedList) -> SinglyLinkedList:
@@ -439,6 +1029,8 @@ def merge_sorted_lists(list1: SinglyLinkedList, list2: SinglyLinkedList) -> Sing
         merged._size += 1
     
     merged.head = dummy.next
+    if merged.head:
+        merged.tail = current
     return merged
 
 
@@ -485,6 +1077,12 @@ if __name__ == "__main__":
     print(f"   Has loop? {sll.detect_loop()}")
     print(f"   As Python list: {sll.to_list()}")
     
+    # Lazy slicing and streams
+    print("\n6. Slices and streams...")
+    print(f"   sll[1:4]: {sll[1:4]}")
+    print(f"   sll[-1]: {sll[-1]}")
+    print(f"   Odd values doubled: {sll.stream().filter(lambda x: x % 2).map(lambda x: x * 2).to_list()}")
+    
     print("\n" + "=" * 60)
     print("DOUBLY LINKED LIST DEMONSTRATION")
     print("=" * 60)
@@ -502,6 +1100,18 @@ if __name__ == "__main__":
     print(f"   After insert at beginning: {dll}")
     dll.reverse()
     print(f"   After reversing: {dll}")
+    print(f"   Every second element, backwards: {dll[::-2]}")
+    
+    print("\n3. Splicing...")
+    other = DoublyLinkedList()
+    for i in [10, 20, 30]:
+        other.insert_at_end(i)
+    dll.splice(2, other)
+    print(f"   After splicing [10, 20, 30] at 2: {dll}")
+    back = dll.split_at(4)
+    print(f"   Split at 4: {dll} | {back}")
+    dll.concat(back)
+    print(f"   Concatenated back: {dll}, length {len(dll)}")
     
     print("\n" + "=" * 60)
     print("CIRCULAR LINKED LIST DEMONSTRATION")
@@ -531,3 +1141,18 @@ if __name__ == "__main__":
     
     merged = merge_sorted_lists(list1, list2)
     print(f"   Merged: {merged}")
+    
+    print("\n" + "=" * 60)
+    print("PERSISTENT LINKED LIST DEMONSTRATION")
+    print("=" * 60)
+    
+    config = PersistentLinkedList([3, 5, 7])
+    snapshot = config
+    config = config.prepend(1)
+    print(f"\n   Snapshot: {snapshot}")
+    print(f"   New version: {config}")
+    print(f"   Tail shares nodes with snapshot? {config.tail().head is snapshot.head}")
+    
+    merged = snapshot.merge_sorted(PersistentLinkedList([2, 4]))
+    print(f"   Merged with [2, 4]: {merged}")
+    print(f"   Reversed: {merged.reverse()}, original: {merged}")
@@ -0,0 +1,156 @@
+"""
+Optional NumPy Interop and Chunked Bulk Operations
+
+Elements are gathered from a linked structure in fixed-size chunks into NumPy
+buffers, so bulk operations run vectorized without first materialising the
+whole structure as a Python list.  NumPy is an optional dependency; it is
+imported the first time one of these functions is called, so importing the
+containers that use this module does not load it.
+"""
+
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+
+# The numpy module once load_numpy() has imported it
+np = None
+
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def load_numpy() -> Optional[Any]:
+    """Import NumPy on first use and return it, or None if it is not installed."""
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:  # NumPy is an optional extra
+            return None
+        np = numpy
+    return np
+
+
+def _require_numpy() -> Any:
+    """Return the numpy module, or raise ImportError if it is not installed."""
+    if load_numpy() is None:
+        raise ImportError("NumPy is required for this operation: pip install numpy")
+    return np
+
+
+def iter_chunks(values: Iterable[Any], dtype: Any = None,
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """Generate arrays holding successive chunks of at most chunk_size elements."""
+    _require_numpy()
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be positive')
+    it = iter(values)
+    while True:
+        items = list(islice(it, chunk_size))
+        if not items:
+            return
+        yield np.asarray(items, dtype=dtype)
+
+
+def iter_elements(arr: Any, reverse: bool = False,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """Generate the elements of a 1-D array as Python objects, chunk by chunk."""
+    _require_numpy()
+    arr = np.asarray(arr)
+    if arr.ndim != 1:
+        raise ValueError('Array must be one-dimensional')
+    if reverse:
+        arr = arr[::-1]
+    for start in range(0, len(arr), chunk_size):
+        yield from arr[start:start + chunk_size].tolist()
+
+
+def _gather(chunks: Iterable[Any], count: int, dtype: Any = None) -> Any:
+    """Copy chunks into a single preallocated array of count rows.
+    The dtype and the shape of each row are taken from the first chunk; the
+    dtype is promoted if a later chunk needs it.  Sequence elements therefore
+    become extra dimensions, e.g. count pairs give a (count, 2) array.
+    """
+    out = None
+    filled = 0
+    for chunk in chunks:
+        if out is None:
+            out = np.empty((count,) + chunk.shape[1:], dtype=chunk.dtype)
+        elif chunk.shape[1:] != out.shape[1:]:
+            raise ValueError(f'Elements must have a consistent shape: '
+                             f'{out.shape[1:]} != {chunk.shape[1:]}')
+        elif not np.can_cast(chunk.dtype, out.dtype):
+            out = out.astype(np.result_type(out.dtype, chunk.dtype))
+        if filled + len(chunk) > count:
+            raise ValueError(f'Expected {count} elements, got more')
+        out[filled:filled + len(chunk)] = chunk
+        filled += len(chunk)
+    if out is None:
+        out = np.empty(0, dtype=dtype)
+    if filled != count:
+        raise ValueError(f'Expected {count} elements, got {filled}')
+    return out
+
+
+def to_array(values: Iterable[Any], count: int, dtype: Any = None,
+             chunk_size: int = DEFAULT_CHUNK_SIZE) -> Any:
+    """Return an array of the count elements produced by values.
+    Scalars give a 1-D array; equal-length sequences give one row per element.
+    """
+    _require_numpy()
+    return _gather(iter_chunks(values, dtype, chunk_size), count, dtype)
+
+
+def bulk_map(values: Iterable[Any], func: Callable[[Any], Any], dtype: Any = None,
+             chunk_size: int = DEFAULT_CHUNK_SIZE) -> Any:
+    """Apply a vectorized func to every chunk and return the results as one array.
+    func receives an array and must return an array of the same length.
+    """
+    _require_numpy()
+    results = (np.asarray(func(chunk)) for chunk in iter_chunks(values, dtype, chunk_size))
+    try:
+        count = len(values)
+    except TypeError:
+        pieces = list(results)
+        return np.concatenate(pieces) if pieces else np.empty(0)
+    return _gather(results, count)
+
+
+def bulk_filter(values: Iterable[Any], predicate: Callable[[Any], Any], dtype: Any = None,
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> Any:
+    """Return an array of the elements selected by a vectorized boolean predicate.
+    predicate receives an array and must return a boolean mask of the same length.
+    """
+    _require_numpy()
+    pieces = [chunk[np.asarray(predicate(chunk), dtype=bool)]
+              for chunk in iter_chunks(values, dtype, chunk_size)]
+    return np.concatenate(pieces) if pieces else np.empty(0)
+
+
+def bulk_sum(values: Iterable[Any], dtype: Any = None,
+             chunk_size: int = DEFAULT_CHUNK_SIZE) -> Any:
+    """Return the sum of all elements, accumulated chunk by chunk."""
+    total = 0
+    for chunk in iter_chunks(values, dtype, chunk_size):
+        total = total + chunk.sum()
+    return total
+
+
+def _bulk_reduce(values: Iterable[Any], reducer: str, dtype: Optional[Any],
+                 chunk_size: int) -> Any:
+    """Reduce every chunk with the named array method, then reduce the partials."""
+    partials = [getattr(chunk, reducer)() for chunk in iter_chunks(values, dtype, chunk_size)]
+    if not partials:
+        raise ValueError(f'bulk_{reducer}() arg is an empty sequence')
+    return getattr(np.asarray(partials), reducer)()
+
+
+def bulk_min(values: Iterable[Any], dtype: Any = None,
+             chunk_size: int = DEFAULT_CHUNK_SIZE) -> Any:
+    """Return the smallest element, computed chunk by chunk."""
+    return _bulk_reduce(values, 'min', dtype, chunk_size)
+
+
+def bulk_max(values: Iterable[Any], dtype: Any = None,
+             chunk_size: int = DEFAULT_CHUNK_SIZE) -> Any:
+    """Return the largest element, computed chunk by chunk."""
+    return _bulk_reduce(values, 'max', dtype, chunk_size)
@@ -0,0 +1,254 @@
+"""
+Chunked Parallel Map/Reduce over Linked Structures
+
+The structure is cut into k balanced segments in a single pass and each
+segment is handed to a worker process as one task, so the per-element cost
+of inter-process communication is amortised over the whole segment.  Plain
+numeric payloads are copied once, chunk by chunk, into a shared-memory array
+that the workers read in place; anything else is pickled one segment at a
+time.  At most max_workers segments are in flight at once.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import islice, repeat
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from binary_tree import BinaryTree
+from numpy_ops import DEFAULT_CHUNK_SIZE, load_numpy
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # platforms without POSIX/Windows shared memory
+    shared_memory = None
+
+
+_MISSING = object()
+
+
+def _source(structure: Any, p: Any = None,
+            order: str = 'inorder') -> Tuple[Callable[[], Iterator[Any]], int]:
+    """Return (factory of fresh element iterators, element count) for a list or (sub)tree.
+    Lists and whole trees know their size. A subtree is walked once, keeping
+    only references to its elements, so the count and the later cuts come from
+    that single traversal.
+    """
+    if isinstance(structure, BinaryTree):
+        if p is None:
+            return (lambda: structure._iter_elements(order)), len(structure)
+        elements = list(structure._iter_elements(order, p))
+        return (lambda: iter(elements)), len(elements)
+    if p is not None:
+        raise TypeError('p is only supported for BinaryTree')
+    return (lambda: iter(structure)), len(structure)
+
+
+def _bounds(count: int, k: int) -> Iterator[Tuple[int, int]]:
+    """Generate (start, stop) of k balanced, non-empty index ranges covering count."""
+    if k < 1:
+        raise ValueError('k must be positive')
+    base, extra = divmod(count, k)
+    start = 0
+    for i in range(min(k, count)):
+        stop = start + base + (1 if i < extra else 0)
+        yield start, stop
+        start = stop
+
+
+def split_segments(structure: Any, k: int, p: Any = None,
+                   order: str = 'inorder') -> Iterator[List[Any]]:
+    """Generate k balanced, order-preserving segments of the elements.
+    For a BinaryTree, p restricts the split to the subtree rooted at p.
+    Segment lengths differ by at most one; no empty segments are produced.
+    """
+    elements, count = _source(structure, p, order)
+    elements = elements()
+    for start, stop in _bounds(count, k):
+        yield list(islice(elements, stop - start))
+
+
+# Python types whose values survive a round trip through the paired array
+# dtype exactly; bool and int subclasses are excluded by the exact type check
+_SHAREABLE = {int: 'int64', float: 'float64'}
+
+
+def _share(elements: Iterator[Any], count: int) -> Optional[Any]:
+    """Copy plain numeric elements into a new SharedMemory block, chunk by chunk.
+    Return (block, dtype), or None (with nothing left allocated) when NumPy or
+    shared memory is unavailable, or when any element would not come back from
+    the array as the same value of the same type: only all-int (within int64)
+    or all-float payloads qualify, and the kinds are never mixed or promoted.
+    """
+    np = load_numpy()
+    if np is None or shared_memory is None or count == 0:
+        return None
+    block = out = None
+    try:
+        filled = 0
+        while True:
+            items = list(islice(elements, DEFAULT_CHUNK_SIZE))
+            if not items:
+                break
+            if block is None:
+                kind = type(items[0])
+                if kind not in _SHAREABLE:
+                    return None
+                dtype = np.dtype(_SHAREABLE[kind])
+                block = shared_memory.SharedMemory(create=True, size=count * dtype.itemsize)
+                out = np.ndarray((count,), dtype=dtype, buffer=block.buf)
+            if any(type(data) is not kind for data in items):
+                raise TypeError('mixed element types')
+            # Raises OverflowError for ints outside int64
+            out[filled:filled + len(items)] = np.array(items, dtype=dtype)
+            filled += len(items)
+        del out
+        return block, dtype.str
+    except (ValueError, TypeError, OverflowError):
+        if block is not None:
+            out = None  # release the exported buffer before closing
+            block.close()
+            block.unlink()
+        return None
+
+
+def _shared_segment(name: str, dtype: str, start: int, stop: int) -> List[Any]:
+    """Worker: return elements start..stop-1 of a shared array as Python numbers."""
+    # Pool workers share the parent's resource tracker, which already owns the block
+    np = load_numpy()
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        view = np.ndarray((stop,), dtype=dtype, buffer=block.buf)
+        segment = view[start:stop].tolist()
+        del view
+    finally:
+        block.close()
+    return segment
+
+
+def _map_segment(func: Callable[[Any], Any], segment: List[Any]) -> List[Any]:
+    """Worker: apply func to every element of one segment."""
+    return [func(data) for data in segment]
+
+
+def _reduce_segment(func: Callable[[Any, Any], Any], segment: List[Any]) -> Any:
+    """Worker: fold one segment with func."""
+    return reduce(func, segment)
+
+
+def _map_shared(func: Callable[[Any], Any], name: str, dtype: str, start: int,
+                stop: int) -> List[Any]:
+    """Worker: apply func to one segment of a shared array."""
+    return _map_segment(func, _shared_segment(name, dtype, start, stop))
+
+
+def _reduce_shared(func: Callable[[Any, Any], Any], name: str, dtype: str, start: int,
+                   stop: int) -> Any:
+    """Worker: fold one segment of a shared array with func."""
+    return _reduce_segment(func, _shared_segment(name, dtype, start, stop))
+
+
+def _bounded(executor: ProcessPoolExecutor, fn: Callable, tasks: Iterable[tuple],
+             window: int) -> Iterator[Any]:
+    """Generate fn(*task) results in order, keeping at most window tasks submitted.
+    Tasks are drawn lazily, so only the in-flight segments exist at any time.
+    """
+    pending = deque()
+    for task in tasks:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, *task))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _run(structure: Any, func: Callable, shared_fn: Callable, pickled_fn: Callable,
+         max_workers: Optional[int], segments: Optional[int], p: Any,
+         order: str) -> Iterator[Any]:
+    """Generate the per-segment results of func, using shared memory when possible."""
+    workers = max_workers or os.cpu_count() or 1
+    k = segments or workers
+    elements, count = _source(structure, p, order)
+    shared = _share(elements(), count)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if shared is not None:
+            block, dtype = shared
+            try:
+                tasks = ((func, block.name, dtype, start, stop)
+                         for start, stop in _bounds(count, k))
+                yield from _bounded(executor, shared_fn, tasks, workers)
+            finally:
+                block.close()
+                block.unlink()
+        else:
+            source = elements()
+            tasks = ((func, list(islice(source, stop - start)))
+                     for start, stop in _bounds(count, k))
+            yield from _bounded(executor, pickled_fn, tasks, workers)
+
+
+def parallel_map(structure: Any, func: Callable[[Any], Any], max_workers: Optional[int] = None,
+                 segments: Optional[int] = None, p: Any = None,
+                 order: str = 'inorder') -> List[Any]:
+    """Return [func(e) for e in structure], computed across a process pool.
+    func must be picklable (e.g. a module-level function).
+    """
+    results = []
+    for part in _run(structure, func, _map_shared, _map_segment,
+                     max_workers, segments, p, order):
+        results.extend(part)
+    return results
+
+
+def parallel_reduce(structure: Any, func: Callable[[Any, Any], Any], initial: Any = _MISSING,
+                    max_workers: Optional[int] = None, segments: Optional[int] = None,
+                    p: Any = None, order: str = 'inorder') -> Any:
+    """Fold the elements with func across a process pool.
+    Each segment is folded in a worker and the partial results are folded
+    again with func, so func must be associative and picklable.
+    """
+    partials = list(_run(structure, func, _reduce_shared, _reduce_segment,
+                         max_workers, segments, p, order))
+    if initial is _MISSING:
+        if not partials:
+            raise TypeError('parallel_reduce() of empty structure with no initial value')
+        return reduce(func, partials)
+    return reduce(func, partials, initial)
+
+
+def _square(x):
+    """Demo transform; must live at module level to be picklable."""
+    return x * x
+
+
+def _add(x, y):
+    """Demo associative combiner."""
+    return x + y
+
+
+# Example usage and tests
+if __name__ == "__main__":
+    from linked_lists import SinglyLinkedList, DoublyLinkedList
+
+    sll = SinglyLinkedList()
+    for i in range(10, 0, -1):
+        sll.insert_at_beginning(i)
+    print(f"List: {sll}")
+    print(f"Segments (k=3): {list(split_segments(sll, 3))}")
+    print(f"Squares: {parallel_map(sll, _square, max_workers=2)}")
+    print(f"Sum: {parallel_reduce(sll, _add, max_workers=2)}")
+
+    dll = DoublyLinkedList()
+    for i in range(1, 6):
+        dll.insert_at_end(i)
+    print(f"\nDoubly linked squares: {parallel_map(dll, _square, max_workers=2)}")
+
+    tree = BinaryTree()
+    root = tree.add_root(1)
+    left = tree.add_left(root, 2)
+    tree.add_right(root, 3)
+    tree.add_left(left, 4)
+    tree.add_right(left, 5)
+    print(f"\nTree (inorder) squares: {parallel_map(tree, _square, max_workers=2)}")
+    print(f"Left subtree sum: {parallel_reduce(tree, _add, p=left, max_workers=2)}")
@@ -0,0 +1,60 @@
+"""
+Tests that instrumentation changes what is recorded, never what the operations do
+"""
+
+import pytest
+
+import instrumentation
+from linked_lists import SinglyLinkedList
+
+
+def build(values):
+    lst = SinglyLinkedList()
+    for data in values:
+        lst.insert_at_end(data)
+    return lst
+
+
+def state(lst):
+    return list(lst), lst._size, lst.head and lst.head.data, lst.tail and lst.tail.data
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    instrumentation.reset()
+    yield
+    instrumentation.reset()
+
+
+@pytest.mark.parametrize('values, value, scanned', [
+    ([], 1, 0),
+    ([1], 1, 1),
+    ([1, 2, 3], 1, 1),
+    ([1, 2, 3], 2, 2),
+    ([1, 2, 3], 3, 3),
+    ([1, 2, 3], 4, 3),
+    ([1, 2, 2, 3], 2, 2),
+])
+def test_delete_by_value_unchanged_when_instrumented(values, value, scanned):
+    plain = build(values)
+    expected = plain.delete_by_value(value)
+
+    traced = build(values)
+    with instrumentation.instrumented():
+        result = traced.delete_by_value(value)
+
+    assert result == expected
+    assert state(traced) == state(plain)
+    entry = instrumentation.stats()['SinglyLinkedList.delete_by_value']
+    assert entry['calls'] == 1
+    assert entry['nodes'] == scanned
+
+
+def test_disable_restores_original_methods():
+    original = SinglyLinkedList.__dict__['delete_by_value']
+    with instrumentation.instrumented():
+        with instrumentation.instrumented():
+            assert SinglyLinkedList.__dict__['delete_by_value'] is not original
+        assert instrumentation.is_enabled()
+    assert not instrumentation.is_enabled()
+    assert SinglyLinkedList.__dict__['delete_by_value'] is original
@@ -0,0 +1,170 @@
+"""
+Behavioural tests for the linked list containers
+"""
+
+import pytest
+
+from linked_lists import (CircularLinkedList, DoublyLinkedList, PersistentLinkedList,
+                          SinglyLinkedList)
+
+
+LIST_TYPES = (SinglyLinkedList, DoublyLinkedList, CircularLinkedList)
+
+
+def build(cls, values):
+    lst = cls()
+    for data in values:
+        lst.insert_at_end(data)
+    return lst
+
+
+def check(lst, expected):
+    """Assert the contents, size and end pointers (and links) of lst."""
+    assert list(lst) == expected
+    assert len(lst) == len(expected)
+    if not expected:
+        assert lst.head is None and lst.tail is None
+        return
+    assert lst.head.data == expected[0]
+    assert lst.tail.data == expected[-1]
+    if isinstance(lst, CircularLinkedList):
+        assert lst.tail.next is lst.head
+    else:
+        assert lst.tail.next is None
+    if isinstance(lst, DoublyLinkedList):
+        assert lst.head.prev is None
+        assert list(reversed(lst)) == expected[::-1]
+        node = lst.head
+        while node.next:
+            assert node.next.prev is node
+            node = node.next
+
+
+@pytest.mark.parametrize('cls', LIST_TYPES)
+@pytest.mark.parametrize('left, right', [([], []), ([1, 2], []), ([], [3, 4]), ([1, 2], [3, 4])])
+def test_concat(cls, left, right):
+    lst, other = build(cls, left), build(cls, right)
+    lst.concat(other)
+    check(lst, left + right)
+    check(other, [])
+    lst.insert_at_end(99)
+    check(lst, left + right + [99])
+
+
+@pytest.mark.parametrize('cls', LIST_TYPES)
+@pytest.mark.parametrize('position', [0, 1, 2, 3])
+@pytest.mark.parametrize('moved', [[], [7], [7, 8]])
+def test_splice(cls, position, moved):
+    values = [0, 1, 2]
+    lst, other = build(cls, values), build(cls, moved)
+    lst.splice(position, other)
+    check(lst, values[:position] + moved + values[position:])
+    check(other, [])
+    lst.insert_at_end(99)
+    check(lst, values[:position] + moved + values[position:] + [99])
+
+
+@pytest.mark.parametrize('cls', LIST_TYPES)
+@pytest.mark.parametrize('moved', [[], [7, 8]])
+def test_splice_into_empty(cls, moved):
+    lst, other = cls(), build(cls, moved)
+    lst.splice(0, other)
+    check(lst, moved)
+    check(other, [])
+
+
+@pytest.mark.parametrize('cls', LIST_TYPES)
+@pytest.mark.parametrize('index', [0, 1, 2, 3])
+def test_split_at(cls, index):
+    values = [0, 1, 2]
+    lst = build(cls, values)
+    back = lst.split_at(index)
+    assert type(back) is cls
+    check(lst, values[:index])
+    check(back, values[index:])
+    lst.insert_at_end(98)
+    back.insert_at_end(99)
+    check(lst, values[:index] + [98])
+    check(back, values[index:] + [99])
+
+
+@pytest.mark.parametrize('cls', LIST_TYPES)
+def test_split_empty(cls):
+    lst = cls()
+    check(lst.split_at(0), [])
+    check(lst, [])
+
+
+@pytest.mark.parametrize('cls', LIST_TYPES)
+def test_splice_rejects_bad_arguments(cls):
+    lst = build(cls, [0, 1])
+    with pytest.raises(IndexError):
+        lst.splice(3, cls())
+    with pytest.raises(IndexError):
+        lst.split_at(-1)
+    with pytest.raises(ValueError):
+        lst.concat(lst)
+    with pytest.raises(TypeError):
+        lst.concat([1, 2])
+
+
+def test_singly_tail_tracking():
+    lst = build(SinglyLinkedList, [3, 1, 1, 2, 2])
+    lst.remove_duplicates()
+    check(lst, [3, 1, 2])
+    lst.reverse()
+    check(lst, [2, 1, 3])
+    lst.delete_from_end()
+    check(lst, [2, 1])
+    lst.delete_from_position(1)
+    check(lst, [2])
+    lst.insert_at_position(5, 1)
+    check(lst, [2, 5])
+    lst.delete_by_value(5)
+    check(lst, [2])
+    lst.delete_from_beginning()
+    check(lst, [])
+    lst.insert_at_beginning(4)
+    check(lst, [4])
+
+
+def test_circular_ends():
+    lst = build(CircularLinkedList, [1, 2])
+    lst.insert_at_beginning(0)
+    check(lst, [0, 1, 2])
+    assert lst.delete_from_beginning() == 0
+    assert lst.delete_from_beginning() == 1
+    assert lst.delete_from_beginning() == 2
+    check(lst, [])
+
+
+def test_persistent_nodes_compare_by_identity():
+    first = PersistentLinkedList(range(5000))
+    second = PersistentLinkedList(range(5000))
+    assert first.head != second.head
+    assert first.head == first.head
+    assert len({first.head, second.head, first.tail().head}) == 3
+    assert first.prepend(-1).head.next is first.head
+
+
+def test_stream_can_be_consumed_again():
+    lst = build(SinglyLinkedList, range(10))
+    odds = lst.stream().filter(lambda x: x % 2).take(5)
+    assert odds.to_list() == [1, 3, 5, 7, 9]
+    assert odds.to_list() == [1, 3, 5, 7, 9]
+    assert odds.first() == 1
+    doubled = odds.map(lambda x: x * 2).skip(1)
+    assert list(doubled) == [6, 10, 14, 18]
+    assert odds.to_list() == [1, 3, 5, 7, 9]
+    lst.insert_at_beginning(-1)
+    assert odds.first() == -1
+
+
+@pytest.mark.parametrize('cls', LIST_TYPES)
+def test_index_error_reports_original_index(cls):
+    lst = build(cls, range(10))
+    assert lst[-10] == 0
+    with pytest.raises(IndexError, match=r"Index -20 out of bounds"):
+        lst[-20]
+    with pytest.raises(IndexError, match=r"Index 10 out of bounds"):
+        lst[10]
@@ -0,0 +1,63 @@
+"""
+Tests for parallel_map/parallel_reduce: results must match the sequential loop
+"""
+
+import pytest
+
+from linked_lists import SinglyLinkedList
+from parallel import _share, parallel_map, parallel_reduce
+
+
+def build(values):
+    lst = SinglyLinkedList()
+    for data in values:
+        lst.insert_at_end(data)
+    return lst
+
+
+def _add(x, y):
+    return x + y
+
+
+PAYLOADS = [
+    [1, 2.5, True, 2 ** 53 + 1],
+    [2.5, 1, 3],
+    [True, False, True],
+    [1, 2, 3, 2 ** 53 + 1],
+    [1, 2 ** 63],
+    [0.5, -0.0, 1e300],
+    ['a', 'b'],
+]
+
+
+@pytest.mark.parametrize('values', PAYLOADS)
+def test_map_matches_sequential(values):
+    assert parallel_map(build(values), repr, max_workers=2) == [repr(data) for data in values]
+
+
+@pytest.mark.parametrize('values', [[1, 2, 3, 2 ** 53 + 1], [0.5, 0.25, 1e300]])
+def test_reduce_matches_sequential(values):
+    total = values[0]
+    for data in values[1:]:
+        total = total + data
+    result = parallel_reduce(build(values), _add, max_workers=2, segments=2)
+    assert result == total and type(result) is type(total)
+
+
+@pytest.mark.parametrize('values, shared', [
+    ([1, 2, 3], True),
+    ([0.5, 1.5], True),
+    ([1, 2.5], False),
+    ([2.5, 1], False),
+    ([1, True], False),
+    ([True, False], False),
+    ([1, 2 ** 63], False),
+])
+def test_only_exact_round_trips_are_shared(values, shared):
+    pytest.importorskip('numpy')
+    result = _share(iter(values), len(values))
+    assert (result is not None) == shared
+    if result is not None:
+        block, _ = result
+        block.close()
+        block.unlink()